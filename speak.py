@@ -7,15 +7,41 @@ Gemini TTS для Claude Code Stop hook
 import json
 import sys
 import os
+import re
+import shutil
 import subprocess
+import struct
+import tempfile
 import base64
-import wave
 import hashlib
+import mmap
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
-import urllib.request
+from queue import Queue
+
+# Быстрый JSON, если установлен (orjson.JSONDecodeError наследует json.JSONDecodeError)
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+API_HOST = "generativelanguage.googleapis.com"
+# Путь к .gguf (например, qwen2.5-0.5b-instruct-q4_k_m) для локального саммари через llama.cpp
+LOCAL_MODEL_PATH = os.environ.get("TTS_LOCAL_MODEL")
 CACHE_DIR = Path.home() / ".claude" / "tts_cache"
+SUMMARY_CACHE_DIR = CACHE_DIR / "summaries"
+SUMMARY_CACHE_MAX = 256  # LRU по atime при превышении
+SUMMARY_WAIT = 0.8  # сек: дольше запасное саммари не ждём
+LOCK_STALE_SECONDS = 60  # лок старше этого остался от убитого процесса
 VOICE = "Aoede"  # Puck, Kore, Charon, Aoede, Fenrir, Leda, Orus, Zephyr
 
 ASMR_PROMPT = """You are a gentle ASMR narrator giving a brief status update. Summarize what was done in 1-2 sentences.
@@ -29,55 +55,37 @@ Examples:
 - "Refactored the database module, added connection pooling" → "Database refactored... now with connection pooling"
 """
 
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def get_cache_path(text: str) -> Path:
-    hash_key = hashlib.md5(f"{text}{VOICE}".encode()).hexdigest()
-    return CACHE_DIR / f"{hash_key}.wav"
+# Тела запросов сериализуются один раз; на каждый вызов в них
+# подставляется только экранированный текст
+TEXT_SLOT = "\x00TEXT\x00"
 
 
-def summarize_asmr(text: str) -> str:
-    """Использует Gemini Flash чтобы сделать ASMR-саммари"""
-    if not GEMINI_API_KEY or not text:
-        return text
+def body_template(payload: dict) -> tuple:
+    """Режет сериализованный JSON по месту для текста на (prefix, suffix)"""
+    prefix, suffix = json_dumps(payload).split(json_dumps(TEXT_SLOT)[1:-1])
+    return prefix, suffix
 
-    request_body = json.dumps({
-        "contents": [
-            {"role": "user", "parts": [{"text": f"{ASMR_PROMPT}\n\nSummarize this:\n{text}"}]}
-        ],
-        "generationConfig": {
-            "maxOutputTokens": 100,
-            "temperature": 0.7
-        }
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent",
-        data=request_body,
-        headers={
-            "x-goog-api-key": GEMINI_API_KEY,
-            "Content-Type": "application/json"
-        }
-    )
 
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read())
-            return data["candidates"][0]["content"]["parts"][0]["text"].strip()
-    except Exception as e:
-        sys.stderr.write(f"Summary error: {e}\n")
-        return text[:200]  # fallback to truncated original
+def build_body(template: tuple, text: str) -> bytes:
+    """Собирает тело запроса из шаблона и текста"""
+    prefix, suffix = template
+    return prefix + json_dumps(text)[1:-1] + suffix
 
 
-def synthesize(text: str, output_path: Path) -> bool:
-    if not GEMINI_API_KEY:
-        return False
+SUMMARY_BODY = body_template({
+    "contents": [
+        {"role": "user", "parts": [{"text": f"{ASMR_PROMPT}\n\nSummarize this:\n{TEXT_SLOT}"}]}
+    ],
+    "generationConfig": {
+        "maxOutputTokens": 100,
+        "temperature": 0.7
+    }
+})
 
-    # Добавляем ASMR стиль в сам TTS запрос
-    styled_text = f"Say this softly and slowly, like a gentle whisper: {text}"
 
-    request_body = json.dumps({
+def tts_body_template(styled_text: str) -> tuple:
+    """Шаблон тела TTS-запроса с голосом VOICE"""
+    return body_template({
         "contents": [{"parts": [{"text": styled_text}]}],
         "generationConfig": {
             "responseModalities": ["AUDIO"],
@@ -87,98 +95,469 @@ def synthesize(text: str, output_path: Path) -> bool:
                 }
             }
         }
-    }).encode()
-
-    req = urllib.request.Request(
-        "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-tts:generateContent",
-        data=request_body,
-        headers={
-            "x-goog-api-key": GEMINI_API_KEY,
-            "Content-Type": "application/json"
-        }
+    })
+
+
+# Саммари и озвучка в одном запросе — без отдельного вызова Gemini Flash
+TTS_SUMMARY_BODY = tts_body_template(f"{ASMR_PROMPT}\n\nSummarize and say softly: {TEXT_SLOT}")
+# Добавляем ASMR стиль в сам TTS запрос
+TTS_PLAIN_BODY = tts_body_template(f"Say this softly and slowly, like a gentle whisper: {TEXT_SLOT}")
+
+# Фильтр до парсинга: большинство строк транскрипта — user/tool/meta записи
+ASSISTANT_RE = re.compile(rb'"type"\s*:\s*"assistant"')
+
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+SUMMARY_CACHE_DIR.mkdir(exist_ok=True)
+
+
+# Голос и режим — ключ BLAKE2b, а не часть хешируемых данных: считаем
+# один раз при импорте, на каждый вызов хешируется только текст.
+# Запросы с саммари — отдельные записи в кеше
+CACHE_KEYS = (VOICE.encode() + b"\x00", VOICE.encode() + b"\x01")
+
+
+def get_cache_path(text: str, summarize: bool = False) -> Path:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16, key=CACHE_KEYS[summarize])
+    return CACHE_DIR / f"{digest.hexdigest()}.wav"
+
+
+# Keep-alive соединение на поток: TLS-рукопожатие платим один раз
+# на все запросы хука (TTS, запасное саммари)
+_local = threading.local()
+
+
+def gemini_post(path: str, body: bytes, timeout: float) -> http.client.HTTPResponse:
+    """POST в Gemini API через переиспользуемое HTTPS-соединение"""
+    for attempt in range(2):
+        conn = getattr(_local, "conn", None)
+        if conn is None:
+            conn = _local.conn = http.client.HTTPSConnection(API_HOST, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request("POST", path, body=body, headers={
+                "x-goog-api-key": GEMINI_API_KEY,
+                "Content-Type": "application/json"
+            })
+            resp = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            # Сервер закрыл простаивающее соединение — переподключаемся один раз
+            conn.close()
+            _local.conn = None
+            if attempt:
+                raise
+            continue
+        if resp.status != 200:
+            detail = resp.read()
+            raise http.client.HTTPException(f"HTTP {resp.status}: {detail[:200]!r}")
+        return resp
+
+
+def summarize_local(text: str):
+    """ASMR-саммари локальной квантованной моделью; None, если недоступна"""
+    if not LOCAL_MODEL_PATH:
+        return None
+    try:
+        from llama_cpp import Llama
+    except ImportError:
+        return None
+
+    try:
+        llm = Llama(
+            model_path=LOCAL_MODEL_PATH,
+            n_ctx=2048,
+            n_threads=max(1, (os.cpu_count() or 2) // 2),
+            n_batch=512,
+            verbose=False
+        )
+        result = llm.create_chat_completion(
+            messages=[
+                {"role": "system", "content": ASMR_PROMPT},
+                {"role": "user", "content": text[:1000]}
+            ],
+            max_tokens=60,
+            temperature=0.7
+        )
+        return result["choices"][0]["message"]["content"].strip() or None
+    except Exception as e:
+        sys.stderr.write(f"Local summary error: {e}\n")
+        return None
+
+
+def summarize_asmr(text: str) -> str:
+    """Делает ASMR-саммари через Gemini Flash, при сбое — локальной моделью"""
+    if not text:
+        return text
+
+    if GEMINI_API_KEY:
+        request_body = build_body(SUMMARY_BODY, text)
+        try:
+            with gemini_post("/v1beta/models/gemini-2.0-flash:generateContent", request_body, 15) as resp:
+                data = json.loads(resp.read())
+                return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+        except Exception as e:
+            sys.stderr.write(f"Summary error: {e}\n")
+
+    # Локальная модель загружается заново в каждом процессе (это секунды),
+    # поэтому она только запасной вариант и не стоит перед быстрым Gemini
+    local_summary = summarize_local(text)
+    if local_summary:
+        return local_summary
+
+    if not GEMINI_API_KEY:
+        return text
+    return text[:200]  # fallback to truncated original
+
+
+def summarize_cached(text: str) -> str:
+    """summarize_asmr() с дисковым кешем по хешу исходного сообщения"""
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    path = SUMMARY_CACHE_DIR / f"{key}.txt"
+
+    try:
+        summary = path.read_text(encoding="utf-8")
+        os.utime(path)  # обновляем atime для LRU (relatime его не трогает)
+        return summary
+    except FileNotFoundError:
+        pass
+
+    summary = summarize_asmr(text)
+    # Фолбэки summarize_asmr (нет ключа / ошибка API) не кешируем
+    if summary in (text, text[:200]):
+        return summary
+
+    try:
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(summary, encoding="utf-8")
+        tmp_path.replace(path)
+        evict_summaries()
+    except OSError as e:
+        sys.stderr.write(f"Summary cache error: {e}\n")
+    return summary
+
+
+def evict_summaries():
+    """Удаляет самые старые саммари, если их больше SUMMARY_CACHE_MAX"""
+    entries = [e for e in os.scandir(SUMMARY_CACHE_DIR) if e.name.endswith(".txt")]
+    if len(entries) <= SUMMARY_CACHE_MAX:
+        return
+    entries.sort(key=lambda e: e.stat().st_atime)
+    for entry in entries[:len(entries) - SUMMARY_CACHE_MAX]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+# Плееры, которые умеют читать сырой PCM (s16le, 24 кГц, моно) из stdin
+RAW_PLAYERS = [
+    ["ffplay", "-f", "s16le", "-ar", "24000", "-ac", "1",
+     "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "-"],
+    ["paplay", "--raw", "--rate=24000", "--format=s16le", "--channels=1"],
+    ["aplay", "-q", "-f", "S16_LE", "-r", "24000", "-c", "1"],
+]
+
+
+def find_player(candidates: list):
+    """Первый установленный плеер из списка: поиск по PATH, без fork на каждый промах"""
+    for player in candidates:
+        path = shutil.which(player[0])
+        if path:
+            return [path] + player[1:]
+    return None
+
+
+# Плееры ищем один раз при импорте
+RAW_PLAYER = find_player(RAW_PLAYERS)
+if sys.platform == "darwin":
+    FILE_PLAYER = ["afplay"]
+else:
+    FILE_PLAYER = find_player([["paplay"], ["aplay", "-q"], ["mpv", "--really-quiet"]])
+
+
+def open_stream_player():
+    """Запускает плеер, принимающий PCM через stdin"""
+    if not RAW_PLAYER:
+        return None
+    return subprocess.Popen(
+        RAW_PLAYER,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def wav_header(n_bytes: int) -> bytes:
+    """44-байтный RIFF/WAVE заголовок для PCM 16 бит, 24 кГц, моно"""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + n_bytes, b'WAVE',
+        b'fmt ', 16, 1, 1, 24000, 24000 * 2, 2, 16,
+        b'data', n_bytes
     )
 
+
+def write_cache(output_path: Path, chunks: Queue):
+    """Пишет чанки из очереди в кеш по мере поступления; None — конец потока, False — отмена"""
+    fd, dir_fd, tmp_path = open_cache_file(output_path)
+    published = False
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read())
-            audio_b64 = data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"]
-            pcm_data = base64.b64decode(audio_b64)
-
-            with wave.open(str(output_path), 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(24000)
-                wf.writeframes(pcm_data)
-            return True
+        # Длина данных известна только в конце: пока пишем заглушку заголовка
+        os.write(fd, wav_header(0))
+        size = 0
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            if chunk is False:
+                return
+            os.write(fd, chunk)
+            size += len(chunk)
+        os.pwrite(fd, wav_header(size), 0)
+        publish_file(fd, dir_fd, tmp_path, output_path)
+        published = True
+    finally:
+        os.close(fd)
+        if dir_fd is not None:
+            os.close(dir_fd)
+        if tmp_path and not published:
+            tmp_path.unlink(missing_ok=True)
+
+
+def open_cache_file(output_path: Path):
+    """Файл для записи кеша, невидимый до publish_file: (fd, dir_fd, tmp_path)"""
+    # Linux: безымянный файл (O_TMPFILE), который появляется в каталоге
+    # только через link() — после того как полностью записан
+    if hasattr(os, "O_TMPFILE"):
+        dir_fd = os.open(str(output_path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            return os.open(".", os.O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd), dir_fd, None
+        except OSError:
+            os.close(dir_fd)  # ФС не поддерживает O_TMPFILE
+
+    # macOS и прочие: уникальный временный файл + rename
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.part")
+    return os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644), None, tmp_path
+
+
+def publish_file(fd: int, dir_fd, tmp_path, output_path: Path):
+    """Атомарно публикует дописанный файл: недописанный WAV в кеш не попадёт"""
+    if tmp_path:
+        tmp_path.replace(output_path)
+        return
+    try:
+        # dst_dir_fd заставляет os.link вызвать linkat(AT_SYMLINK_FOLLOW)
+        os.link(f"/proc/self/fd/{fd}", output_path.name,
+                dst_dir_fd=dir_fd, follow_symlinks=True)
+    except FileExistsError:
+        pass  # другой процесс уже опубликовал тот же файл
+
+
+def synthesize(text: str, output_path: Path, summarize: bool = False) -> bool:
+    """Стримит аудио в плеер по мере генерации и параллельно пишет кеш"""
+    if not GEMINI_API_KEY:
+        return False
+
+    request_body = build_body(TTS_SUMMARY_BODY if summarize else TTS_PLAIN_BODY, text)
+
+    chunks: Queue = Queue()
+    writer = threading.Thread(target=write_cache, args=(output_path, chunks))
+    writer.start()
+    player = None
+    player_tried = False
+    received = []  # Полученные чанки: при обрыве без плеера их играем из памяти
+    streamed = False
+
+    try:
+        with gemini_post(
+            "/v1beta/models/gemini-2.5-flash-preview-tts:streamGenerateContent?alt=sse",
+            request_body, 60
+        ) as resp:
+            # SSE: каждое событие — строка "data: {...}"
+            for line in resp:
+                if not line.startswith(b"data:"):
+                    continue
+                data = json_loads(line[5:])
+                # Финальные события (finishReason, usageMetadata, стоп по
+                # безопасности) приходят без parts — пропускаем их
+                candidates = data.get("candidates") or ({},)
+                for part in candidates[0].get("content", {}).get("parts", ()):
+                    if "inlineData" not in part:
+                        continue
+                    pcm_chunk = base64.b64decode(part["inlineData"]["data"])
+                    chunks.put(pcm_chunk)
+                    received.append(pcm_chunk)
+                    if not player_tried:
+                        player_tried = True
+                        player = open_stream_player()
+                    if player:
+                        try:
+                            player.stdin.write(pcm_chunk)
+                            player.stdin.flush()
+                            streamed = True
+                        except BrokenPipeError:
+                            player = None
+        chunks.put(None if received else False)
+        writer.join()
+        # Нет плеера для сырого PCM (например, macOS без ffplay) — играем WAV из кеша
+        if received and not streamed:
+            play_async(output_path)
+        return bool(received)
     except Exception as e:
         sys.stderr.write(f"TTS error: {e}\n")
-        return False
+        chunks.put(False)
+        # Кеш отменён, но полученное аудио ещё не звучало — играем его
+        if received and not streamed:
+            play_chunks(received)
+        # Если часть аудио уже проиграна, повторять запрос не нужно
+        return bool(received)
+    finally:
+        if player:
+            try:
+                player.stdin.close()
+            except BrokenPipeError:
+                pass
+        if writer.is_alive():
+            writer.join()
 
 
 def play_async(audio_path: Path):
-    if sys.platform == "darwin":
-        subprocess.Popen(
-            ["afplay", str(audio_path)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
-    else:
-        for player in [["paplay"], ["aplay", "-q"], ["mpv", "--really-quiet"]]:
+    if not FILE_PLAYER:
+        return
+    subprocess.Popen(
+        FILE_PLAYER + [str(audio_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def play_chunks(pcm_chunks: list):
+    """Проигрывает PCM из памяти через временный WAV и удаляет его"""
+    if not FILE_PLAYER:
+        return
+    fd, tmp_name = tempfile.mkstemp(suffix=".wav")
+    try:
+        with open(fd, "wb") as f:
+            f.write(wav_header(sum(map(len, pcm_chunks))))
+            f.writelines(pcm_chunks)
+        subprocess.run(FILE_PLAYER + [tmp_name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    finally:
+        os.unlink(tmp_name)
+
+
+def acquire_lock(lock_path: Path) -> bool:
+    """Лок-файл на время синтеза, чтобы параллельные хуки не дублировали запрос"""
+    for _ in range(2):
+        try:
+            os.close(os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return True
+        except FileExistsError:
             try:
-                subprocess.Popen(
-                    player + [str(audio_path)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    start_new_session=True
-                )
-                break
+                if time.time() - lock_path.stat().st_mtime < LOCK_STALE_SECONDS:
+                    return False
+                lock_path.unlink()
             except FileNotFoundError:
-                continue
+                pass
+    return False
 
 
-def speak(text: str):
+def speak(text: str, summarize: bool = False):
     if not text or not GEMINI_API_KEY:
         return
 
-    cache_path = get_cache_path(text)
-    if not cache_path.exists():
-        if not synthesize(text, cache_path):
+    cache_path = get_cache_path(text, summarize)
+    if cache_path.exists():
+        play_async(cache_path)
+        return
+
+    lock_path = cache_path.with_suffix(".lock")
+    if not acquire_lock(lock_path):
+        # Этот же текст уже синтезирует другой процесс — он его и проиграет
+        return
+
+    try:
+        # Промах кеша: synthesize() сам проигрывает аудио по мере поступления
+        if synthesize(text, cache_path, summarize):
+            return
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+    if summarize:
+        # Запасной путь: отдельное саммари через Gemini Flash, затем обычный TTS
+        speak_fallback(text)
+
+
+def speak_fallback(text: str):
+    """Ждёт саммари не дольше SUMMARY_WAIT, иначе озвучивает первое предложение"""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(summarize_cached, text)
+        try:
+            summary = future.result(timeout=SUMMARY_WAIT)
+        except FutureTimeout:
+            # Саммари не успело — говорим начало сообщения, а саммари
+            # тем временем допишется в кеш для следующего раза
+            speak(text.split(".")[0][:200])
             return
-    play_async(cache_path)
+    speak(summary)
+
+
+def entry_text(entry: dict) -> str:
+    """Собирает текст из text-блоков записи ассистента"""
+    message = entry.get("message", {})
+    content = message.get("content", [])
+    if not content:
+        return ""
+
+    texts = [block["text"] for block in content
+             if type(block) is dict and block.get("type") == "text" and "text" in block]
+    # Редкий случай: строковые блоки
+    texts += [block for block in content if type(block) is str]
+    return " ".join(texts)
+
+
+def iter_lines_reversed(path: str):
+    """Отдаёт строки файла с последней к первой через mmap (без копирования префикса)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            return
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # mmap держит собственную копию дескриптора
+        os.close(fd)
+
+    try:
+        if hasattr(mmap, "MADV_RANDOM"):
+            # Идём с конца: упреждающее чтение вперёд только мешает
+            mm.madvise(mmap.MADV_RANDOM)
+        end = size
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end) + 1
+            yield mm[start:end]
+            end = start - 1
+    finally:
+        mm.close()
 
 
 def extract_last_assistant_message(transcript_path: str) -> str:
     """Читает JSONL транскрипт и возвращает последнее сообщение ассистента"""
     try:
-        messages = []
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    messages.append(entry)
-                except json.JSONDecodeError:
-                    continue
+        for line in iter_lines_reversed(transcript_path):
+            # Дешёвая проверка регуляркой до json.loads: нужны только записи ассистента
+            if not ASSISTANT_RE.search(line):
+                continue
+            try:
+                entry = json_loads(line)
+            except json.JSONDecodeError:
+                continue
 
-        # Ищем последнее сообщение ассистента (в обратном порядке)
-        for entry in reversed(messages):
             if entry.get("type") == "assistant":
-                message = entry.get("message", {})
-                content = message.get("content", [])
-
-                # Собираем текст из всех text-блоков
-                texts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        texts.append(block.get("text", ""))
-                    elif isinstance(block, str):
-                        texts.append(block)
-
-                if texts:
-                    return " ".join(texts)
+                text = entry_text(entry)
+                if text:
+                    return text
 
         return ""
     except Exception as e:
@@ -207,9 +586,8 @@ def main():
         speak("Готово")
         sys.exit(0)
 
-    # Создаём ASMR-саммари через Gemini Flash
-    asmr_summary = summarize_asmr(last_message)
-    speak(asmr_summary)
+    # Саммари делает сама TTS-модель по ASMR-промпту
+    speak(last_message[:1000], summarize=True)
     sys.exit(0)
 
 
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Claude Code Stop Hook for TTS
-Extracts last assistant message and sends to TTS daemon.
+Forwards the raw hook payload to the TTS daemon, which reads the transcript
+with extract_last_assistant_message() from this module.
 
 Usage in ~/.claude/settings.json:
 {
@@ -18,48 +19,84 @@ Usage in ~/.claude/settings.json:
 """
 
 import json
+import mmap
 import os
+import re
 import socket
+import struct
 import sys
 from pathlib import Path
 
+# Optional faster JSON parser (orjson.JSONDecodeError subclasses json's)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Paths
 SOCKET_PATH = Path("/tmp/claude-tts.sock")
+DGRAM_SOCKET_PATH = Path("/tmp/claude-tts.dgram.sock")
+
+# Pre-parse filter: most transcript lines are user/tool/meta entries
+ASSISTANT_RE = re.compile(rb'"type"\s*:\s*"assistant"')
+
+
+def entry_text(entry: dict) -> str:
+    """Join text blocks of an assistant transcript entry."""
+    message = entry.get("message", {})
+    content = message.get("content", [])
+    if not content:
+        return ""
+
+    texts = [block["text"] for block in content
+             if type(block) is dict and block.get("type") == "text" and "text" in block]
+    # Rare case: plain string blocks
+    texts += [block for block in content if type(block) is str]
+    return " ".join(texts)
 
-# Config
-MAX_TEXT_LENGTH = 1000
+
+def iter_lines_reversed(path: str):
+    """Yield lines of a file from last to first via a read-only memory map."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            return
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # mmap keeps its own duplicate of the descriptor
+        os.close(fd)
+
+    try:
+        if hasattr(mmap, "MADV_RANDOM"):
+            # We scan from the end; forward readahead would only waste I/O
+            mm.madvise(mmap.MADV_RANDOM)
+        end = size
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end) + 1
+            yield mm[start:end]
+            end = start - 1
+    finally:
+        mm.close()
 
 
 def extract_last_assistant_message(transcript_path: str) -> str:
     """Extract last assistant text message from JSONL transcript."""
     try:
-        messages = []
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    messages.append(entry)
-                except json.JSONDecodeError:
-                    continue
-
-        # Find last assistant message (reverse order)
-        for entry in reversed(messages):
-            if entry.get("type") == "assistant":
-                message = entry.get("message", {})
-                content = message.get("content", [])
-
-                texts = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        texts.append(block.get("text", ""))
-                    elif isinstance(block, str):
-                        texts.append(block)
+        for line in iter_lines_reversed(transcript_path):
+            # Cheap regex check before json.loads: only assistant entries matter
+            if not ASSISTANT_RE.search(line):
+                continue
+            try:
+                entry = json_loads(line)
+            except json.JSONDecodeError:
+                continue
 
-                if texts:
-                    return " ".join(texts)
+            if entry.get("type") == "assistant":
+                text = entry_text(entry)
+                if text:
+                    return text
 
         return ""
     except Exception as e:
@@ -67,10 +104,24 @@ def extract_last_assistant_message(transcript_path: str) -> str:
         return ""
 
 
+def send_to_daemon(data: bytes) -> bool:
+    """Send message bytes to TTS daemon via Unix socket."""
+    # One datagram, no connect/accept. Falls back to the stream socket when the
+    # daemon has no datagram socket or the message exceeds the datagram size
+    # limit (about 2 KB by default on macOS). Non-blocking: sendto() would
+    # otherwise hang while a wedged daemon's receive queue is full; that
+    # raises BlockingIOError instead and also falls back.
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.setblocking(False)
+            sock.sendto(data, str(DGRAM_SOCKET_PATH))
+            return True
+        finally:
+            sock.close()
+    except OSError:
+        pass
 
-
-def send_to_daemon(text: str) -> bool:
-    """Send text to TTS daemon via Unix socket."""
     if not SOCKET_PATH.exists():
         sys.stderr.write(f"TTS daemon not running (socket not found: {SOCKET_PATH})\n")
         return False
@@ -79,7 +130,8 @@ def send_to_daemon(text: str) -> bool:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.settimeout(5.0)
         sock.connect(str(SOCKET_PATH))
-        sock.sendall(text.encode('utf-8'))
+        # Length prefix so the daemon knows when the message is complete
+        sock.sendall(struct.pack('!I', len(data)) + data)
         sock.close()
         return True
     except Exception as e:
@@ -88,30 +140,14 @@ def send_to_daemon(text: str) -> bool:
 
 
 def main():
-    # Read hook input from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-    except Exception as e:
-        sys.stderr.write(f"JSON input error: {e}\n")
-        sys.exit(0)
-
-    transcript_path = hook_data.get("transcript_path", "")
-
-    # Fallback message if no transcript
-    if not transcript_path or not os.path.exists(transcript_path):
-        send_to_daemon("Done")
-        sys.exit(0)
-
-    # Extract last message
-    last_message = extract_last_assistant_message(transcript_path)
-
-    if not last_message:
-        send_to_daemon("Ready")
+    # Forward hook JSON as-is; the already running daemon parses it and the
+    # transcript, so this process does no JSON or transcript work
+    payload = sys.stdin.buffer.read().strip()
+    if not payload:
+        sys.stderr.write("JSON input error: empty hook input\n")
         sys.exit(0)
 
-    # Send raw text to daemon (limited to MAX_TEXT_LENGTH)
-    text_to_send = last_message[:MAX_TEXT_LENGTH]
-    send_to_daemon(text_to_send)
+    send_to_daemon(payload)
     sys.exit(0)
 
 
@@ -11,10 +11,12 @@ Test:
 """
 
 import asyncio
+import collections
 import hashlib
 import json
 import logging
 import os
+import shutil
 import signal
 import socket
 import struct
@@ -23,9 +25,8 @@ import subprocess
 import tempfile
 import threading
 import time
-import wave
+from functools import lru_cache
 from pathlib import Path
-from queue import Queue, Empty
 from typing import Optional
 
 # HTTP server
@@ -35,6 +36,22 @@ try:
 except ImportError:
     HAS_AIOHTTP = False
 
+# Transcript parsing shared with the hook (installed side by side); without
+# it hook payloads are answered with a generic "Done"
+try:
+    from speak_hook import extract_last_assistant_message
+except ImportError:
+    extract_last_assistant_message = None
+
+# Optional fast non-cryptographic hash for cache keys; 64 bits (16 hex chars)
+# is plenty for a per-user cache and keeps file names short
+try:
+    import xxhash
+    new_cache_hash = xxhash.xxh3_64
+except ImportError:
+    def new_cache_hash():
+        return hashlib.blake2b(digest_size=8)
+
 # Optional streaming audio support
 try:
     import sounddevice as sd
@@ -43,13 +60,24 @@ try:
 except ImportError:
     HAS_SOUNDDEVICE = False
 
+# Optional libuv-based event loop: cheaper awaits for the many small audio frames
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Paths
 CLAUDE_DIR = Path.home() / ".claude"
 SOCKET_PATH = Path("/tmp/claude-tts.sock")
+DGRAM_SOCKET_PATH = Path("/tmp/claude-tts.dgram.sock")
 PID_FILE = CLAUDE_DIR / "tts_daemon.pid"
 CACHE_DIR = CLAUDE_DIR / "tts_cache"
 LOG_FILE = CLAUDE_DIR / "tts_daemon.log"
 CONFIG_PATH = CLAUDE_DIR / "tts_config.json"
+# Hook payloads may only point at transcripts in here: the sockets accept
+# requests from any local user
+TRANSCRIPTS_DIR = CLAUDE_DIR / "projects"
 
 # HTTP Server
 HTTP_PORT = 8787
@@ -81,6 +109,42 @@ LANGUAGES = {
     "japanese": "Speak in Japanese"
 }
 
+# Idle Live sessions kept for quick config switches
+SESSION_POOL_SIZE = 2
+# Pooled sessions are not pinged, so don't reuse them past the keepalive
+# interval: proxies drop idle sockets after about a minute
+SESSION_POOL_MAX_IDLE = 30  # seconds, = KEEPALIVE_INTERVAL
+
+# Incoming requests wait in a bounded queue for the speak workers; two
+# workers so a request can overlap the previous one on a spare session
+SPEAK_QUEUE_SIZE = 32
+SPEAK_WORKERS = 2
+
+# Cache misses arriving this close together while a synthesis is already
+# running are spoken as one Live API turn
+COALESCE_WINDOW = 0.02  # seconds
+
+# Config fields that select a distinct cached recording of the same text
+CACHE_KEY_FIELDS = ("voice", "style", "mode", "language")
+
+# Audio cache size cap; eviction removes least recently used files down to
+# CACHE_LOW_WATER of the cap so it doesn't rerun on every new entry
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_LOW_WATER = 0.8
+
+# Recently seen (text, config) -> cache file, so repeats skip hashing and stat()
+AUDIO_PATH_CACHE_SIZE = 512
+
+# WebSocket keepalive: ping idle sessions before proxies drop them (~60s)
+KEEPALIVE_INTERVAL = 30
+KEEPALIVE_TIMEOUT = 10
+
+# Stream socket framing: 4-byte big-endian length, then the UTF-8 payload.
+# MAX_MSG stays below 16 MiB, so a framed message always starts with a zero
+# byte and plain text (e.g. from nc) can still be told apart; plain text is
+# read up to a newline. Also the StreamReader buffer limit
+MAX_MSG = 64 * 1024
+
 VOICES = ["Aoede", "Kore", "Puck", "Charon", "Fenrir", "Leda", "Orus", "Zephyr"]
 
 DEFAULT_CONFIG = {
@@ -93,22 +157,49 @@ DEFAULT_CONFIG = {
 }
 
 
+# Parsed config and its instruction, keyed by the config file's (mtime, size)
+_config_cache = {"key": None, "config": None, "instruction": None}
+
+
+def load_config_and_instruction() -> tuple[dict, str]:
+    """Load config and its system instruction, re-parsing only when the file changes."""
+    try:
+        st = CONFIG_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    if _config_cache["config"] is None or key != _config_cache["key"]:
+        config = DEFAULT_CONFIG.copy()
+        if key is not None:
+            try:
+                # Merge with defaults for missing keys
+                config = {**DEFAULT_CONFIG, **json.loads(CONFIG_PATH.read_text())}
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to load config: {e}, using defaults")
+        _config_cache.update(key=key, config=config, instruction=build_instruction(config))
+
+    return _config_cache["config"].copy(), _config_cache["instruction"]
+
+
 def load_config() -> dict:
     """Load config from file, fallback to defaults."""
-    if CONFIG_PATH.exists():
-        try:
-            config = json.loads(CONFIG_PATH.read_text())
-            # Merge with defaults for missing keys
-            return {**DEFAULT_CONFIG, **config}
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load config: {e}, using defaults")
-    return DEFAULT_CONFIG.copy()
+    return load_config_and_instruction()[0]
+
+
+def instruction_for(config: dict) -> str:
+    """System instruction for config, reusing the cached one when it matches."""
+    if config == _config_cache["config"]:
+        return _config_cache["instruction"]
+    return build_instruction(config)
 
 
 def save_config(config: dict) -> bool:
     """Save config to file."""
     try:
         CONFIG_PATH.write_text(json.dumps(config, indent=2, ensure_ascii=False))
+        # Coarse mtime resolution (e.g. HFS+) could hide a quick rewrite
+        _config_cache["config"] = None
         return True
     except IOError as e:
         logger.error(f"Failed to save config: {e}")
@@ -158,68 +249,116 @@ def build_instruction(config: dict) -> str:
     return ". ".join(parts) + "."
 
 
+class TurnNotStarted(Exception):
+    """A Live API turn failed before any audio arrived, e.g. on a stale session."""
+
+
 class StreamingAudioPlayer:
-    """Low-latency audio player using sounddevice with queue-based streaming."""
+    """Low-latency audio player: a writer thread feeds a blocking sounddevice stream."""
 
-    def __init__(self, sample_rate: int = 24000, channels: int = 1, pre_buffer_chunks: int = 2):
+    def __init__(self, sample_rate: int = 24000, channels: int = 1, pre_buffer_chunks: int = 2,
+                 blocksize: int = 2048, open_stream=None, stream_lock: Optional[threading.Lock] = None):
         self.sample_rate = sample_rate
         self.channels = channels
         self.pre_buffer_chunks = pre_buffer_chunks
-        self.queue: Queue = Queue()
+        self.blocksize = blocksize
+        # Single producer (feed) / single consumer (writer): deque append and
+        # popleft are atomic, so the hot path takes no lock
+        self.queue: collections.deque = collections.deque()
+        self.data_ready = threading.Event()
+        # A caller-owned stream (open_stream() returns it, called by the writer
+        # with stream_lock held) is written to but never stopped or closed here
         self.stream = None
+        self.open_stream = open_stream
+        self.owns_stream = open_stream is None
+        self.stream_lock = stream_lock
+        self.writer = None
+        self.block = None  # Preallocated int16 write buffer, see start()
         self.started = False
+        self.failed = False  # Set if the device rejected a write
         self.finished = False
         self.chunks_received = 0
         self.lock = threading.Lock()
         self.total_bytes_fed = 0
 
-    def _audio_callback(self, outdata, frames, time_info, status):
-        """Callback called by sounddevice to fill audio buffer."""
-        if status:
-            logger.warning(f"Audio callback status: {status}")
+    def _writer(self):
+        """Drain the queue into the stream.
 
-        bytes_needed = frames * self.channels * 2  # 16-bit = 2 bytes
-        data = b''
-
-        while len(data) < bytes_needed:
-            try:
-                chunk = self.queue.get_nowait()
-                data += chunk
-            except Empty:
-                if self.finished:
-                    # No more data coming, pad with silence
-                    data += b'\x00' * (bytes_needed - len(data))
-                    break
-                else:
-                    # Underrun - pad with silence and continue
-                    data += b'\x00' * (bytes_needed - len(data))
-                    break
+        stream.write() blocks inside PortAudio's C code, so no Python runs on
+        the realtime audio thread and GIL contention cannot cause underruns.
+        Small network chunks are copied into one preallocated block, so the
+        device gets full blocks without per-chunk allocation or bytes concat.
+        """
+        try:
+            if self.stream_lock:
+                # Keep other writers of a shared stream out for the whole
+                # utterance; the lock is only taken once audio has arrived
+                with self.stream_lock:
+                    if self.open_stream:
+                        self.stream = self.open_stream()
+                    self._drain()
+            else:
+                self._drain()
+        except Exception as e:
+            logger.warning(f"Audio stream write failed: {e}")
+            self.failed = True
 
-        # Trim if we got too much
-        data = data[:bytes_needed]
+    def _drain(self):
+        block_bytes = memoryview(self.block).cast('B')
+        size = len(block_bytes)
+        filled = 0
 
-        # Convert to numpy array
-        audio_array = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-        outdata[:] = audio_array.reshape(-1, self.channels)
+        while True:
+            try:
+                chunk = self.queue.popleft()
+            except IndexError:
+                self.data_ready.wait()
+                self.data_ready.clear()
+                continue
+            if chunk is None:
+                break
+
+            view = memoryview(chunk)
+            while view:
+                n = min(size - filled, len(view))
+                block_bytes[filled:filled + n] = view[:n]
+                filled += n
+                view = view[n:]
+                if filled == size:
+                    self.stream.write(self.block.reshape(-1, self.channels))
+                    filled = 0
+
+            # Don't hold a partial block back while the device may be starving
+            if filled and not self.queue:
+                self.stream.write(self.block[:filled // 2].reshape(-1, self.channels))
+                filled = 0
+
+        if filled:
+            self.stream.write(self.block[:filled // 2].reshape(-1, self.channels))
 
     def start(self):
-        """Start the audio stream."""
+        """Start the audio stream and the writer thread."""
         if self.started:
             return
         self.started = True
-        self.stream = sd.OutputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype=np.float32,
-            callback=self._audio_callback,
-            blocksize=1024
-        )
-        self.stream.start()
+        self.block = np.empty(self.blocksize * self.channels, dtype=np.int16)
+        if self.owns_stream:
+            self.stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype='int16',
+                blocksize=self.blocksize,
+                latency='high'
+            )
+            self.stream.start()
+        self.writer = threading.Thread(target=self._writer, daemon=True)
+        self.writer.start()
         logger.debug("Audio stream started")
 
     def feed(self, pcm_data: bytes):
         """Feed PCM data to the player."""
-        self.queue.put(pcm_data)
+        self.queue.append(pcm_data)
+        self.data_ready.set()
         self.chunks_received += 1
         self.total_bytes_fed += len(pcm_data)
 
@@ -229,38 +368,162 @@ class StreamingAudioPlayer:
 
     def finish(self):
         """Signal that no more data is coming."""
+        if self.finished:
+            return
         self.finished = True
 
         # If we never started (very short audio), start now
         if not self.started and self.chunks_received > 0:
             self.start()
+        self.queue.append(None)
+        self.data_ready.set()
 
     async def wait_done(self, timeout: float = 30.0):
         """Wait for playback to complete."""
-        if not self.stream:
+        if not self.writer:
             return
 
-        # Calculate expected duration based on total bytes fed
         duration = self.total_bytes_fed / (self.sample_rate * self.channels * 2)  # 2 bytes per Int16 sample
         logger.debug(f"Expecting {duration:.2f}s of audio ({self.total_bytes_fed} bytes)")
 
-        # Wait for queue to drain
-        while not self.queue.empty():
-            await asyncio.sleep(0.05)
-
-        # Sleep for the expected duration to let audio finish playing
-        await asyncio.sleep(duration)
+        # Writer returns once the last chunk has been handed to PortAudio
+        await asyncio.to_thread(self.writer.join, duration + timeout)
+        if not self.owns_stream:
+            return
 
-        self.stream.stop()
+        # stop() lets pending buffers play out before closing
+        await asyncio.to_thread(self.stream.stop)
         self.stream.close()
         logger.debug("Audio stream closed")
 
 
+class PipeAudioPlayer:
+    """Streams live chunks into the warm raw PCM player process.
+
+    Same feed/finish/wait_done interface as StreamingAudioPlayer. A writer
+    thread does the blocking pipe writes, so a full pipe never stalls the
+    event loop; it holds the player lock from the first chunk to the end of
+    the utterance, so finish() must always be called.
+    """
+
+    def __init__(self, write, lock: threading.Lock):
+        self.write = write  # Callable[[bytes], bool], called with lock held
+        self.lock = lock
+        self.queue: collections.deque = collections.deque()
+        self.data_ready = threading.Event()
+        self.finished = False
+        self.failed = False
+        self.writer = threading.Thread(target=self._writer, daemon=True)
+        self.writer.start()
+
+    def _writer(self):
+        # Don't hold the player lock while the turn is still waiting on the network
+        while not self.queue:
+            self.data_ready.wait()
+            self.data_ready.clear()
+        if self.queue[0] is None:
+            return
+
+        with self.lock:
+            while True:
+                try:
+                    chunk = self.queue.popleft()
+                except IndexError:
+                    self.data_ready.wait()
+                    self.data_ready.clear()
+                    continue
+                if chunk is None:
+                    break
+                if not self.failed and not self.write(chunk):
+                    self.failed = True
+            if not self.failed:
+                self.write(UTTERANCE_GAP)
+
+    def feed(self, pcm_data: bytes):
+        """Feed PCM data to the player."""
+        self.queue.append(pcm_data)
+        self.data_ready.set()
+
+    def finish(self):
+        """Signal that no more data is coming."""
+        if self.finished:
+            return
+        self.finished = True
+        self.queue.append(None)
+        self.data_ready.set()
+
+    async def wait_done(self):
+        """Wait until everything has been handed to the player process."""
+        await asyncio.to_thread(self.writer.join)
+
+
 # Audio config
 SAMPLE_RATE = 24000
 CHANNELS = 1
 SAMPLE_WIDTH = 2  # 16-bit
 
+# Players that accept raw s16le PCM on stdin (kept running between utterances)
+RAW_PLAYERS = [
+    ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet",
+     "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", str(CHANNELS), "-i", "-"],
+    ["paplay", "--raw", f"--rate={SAMPLE_RATE}", "--format=s16le", f"--channels={CHANNELS}"],
+    ["aplay", "-q", "-f", "S16_LE", "-r", str(SAMPLE_RATE), "-c", str(CHANNELS)],
+]
+# Players for audio files, in order of preference
+FILE_PLAYERS = [["paplay"], ["aplay", "-q"], ["mpv", "--really-quiet"]]
+# Spawned file players get /dev/null for stdio
+PLAYER_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+# How often exited file players are polled for; the next queued utterance
+# starts at most this long after the previous one ends
+REAP_INTERVAL = 0.1  # seconds
+# Silence appended after each utterance so the next one doesn't clip it
+UTTERANCE_GAP = b'\x00' * (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS // 2)
+
+
+def wav_header(n_bytes: int) -> bytes:
+    """44-byte RIFF/WAVE header for n_bytes of PCM in the fixed daemon format."""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + n_bytes, b'WAVE',
+        b'fmt ', 16, 1, CHANNELS, SAMPLE_RATE,
+        SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH, CHANNELS * SAMPLE_WIDTH, SAMPLE_WIDTH * 8,
+        b'data', n_bytes
+    )
+
+
+def resolve_file_player() -> Optional[list[str]]:
+    """Find the audio file player command (PATH lookup only, no fork)."""
+    if sys.platform == "darwin":
+        return ["afplay"]
+    for player in FILE_PLAYERS:
+        exe = shutil.which(player[0])
+        if exe:
+            return [exe] + player[1:]
+    return None
+
+
+# Cached clips up to this size (5 s of audio) are also kept in memory
+PCM_MEMO_MAX_BYTES = SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS * 5
+
+
+def load_pcm(path: Path) -> bytes:
+    """Read a cached raw PCM file; blocking, call it off the event loop."""
+    if path.stat().st_size <= PCM_MEMO_MAX_BYTES:
+        return load_short_pcm(path)
+    return path.read_bytes()
+
+
+@lru_cache(maxsize=32)
+def load_short_pcm(path: Path) -> bytes:
+    """Cache files are immutable, so recent short phrases ("Done", "Ready",
+    ...) are kept in memory: 32 x PCM_MEMO_MAX_BYTES (~7.5 MB) at most."""
+    return path.read_bytes()
+
+
 # Setup logging
 def setup_logging(debug: bool = False):
     level = logging.DEBUG if debug else logging.INFO
@@ -276,99 +539,278 @@ def setup_logging(debug: bool = False):
 logger = logging.getLogger(__name__)
 
 
+class DatagramHandler(asyncio.DatagramProtocol):
+    """Receives one message per datagram on the Unix datagram socket."""
+
+    def __init__(self, on_message):
+        self.on_message = on_message
+
+    def datagram_received(self, data: bytes, addr):
+        self.on_message(data)
+
+
 class TTSDaemon:
     def __init__(self):
         self.running = False
         self.session = None
         self.session_cm = None  # Context manager for session
         self.client = None
+        self.make_turn = None  # text -> turns for send_client_content, set on first connect
         self.reconnect_delay = 1
         self.max_reconnect_delay = 30
         self.current_config = None  # Track config for reconnection
+        # Held for a whole turn on self.session; overlapping requests use a spare
+        self.session_lock = asyncio.Lock()
+        # session_key -> (session, session_cm, config, parked_at)
+        self.session_pool: dict[tuple, tuple] = {}
+        self.speak_queue: asyncio.Queue = asyncio.Queue(maxsize=SPEAK_QUEUE_SIZE)
+        self.pending_texts: list[str] = []  # Batch collected during COALESCE_WINDOW
+        self.cache_bytes = 0  # Audio cache size, measured at startup, then tracked
+        # Paths of cached audio files, scanned at startup, then tracked, so
+        # lookups need no stat()
+        self.known_cache: set[str] = set()
+        # Cache file -> wall-clock time of its last hit. Eviction can't go by
+        # atime alone: hits served by load_pcm() from memory don't read the
+        # file, and relatime/noatime mounts rarely update it anyway
+        self.last_played: dict[str, float] = {}
+        self.evict_task: Optional[asyncio.Task] = None
+        # LRU of cache files known to exist, see AUDIO_PATH_CACHE_SIZE
+        self.audio_paths: collections.OrderedDict[tuple, Path] = collections.OrderedDict()
+        self.file_player = resolve_file_player()
+        # Spawned file players not yet reaped -> (temp file to delete
+        # afterwards, future resolved on exit)
+        self.player_pids: dict[int, tuple[Optional[Path], asyncio.Future]] = {}
+        self.reaper_task: Optional[asyncio.Task] = None
+        # Resolved when the last queued file player has exited; the next one
+        # waits for it so utterances don't overlap
+        self.player_done: Optional[asyncio.Future] = None
+        self.pcm_player: Optional[subprocess.Popen] = None
+        self.pcm_player_lock = threading.Lock()
+        self.play_stream = None  # Long-lived sounddevice output stream
+        self.play_stream_lock = threading.Lock()
 
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     def get_cache_path(self, text: str, config: dict) -> Path:
         """Generate cache path based on text and config hash."""
-        cache_key = f"{text}:{config.get('voice')}:{config.get('style')}:{config.get('mode')}:{config.get('language')}"
-        hash_key = hashlib.md5(cache_key.encode()).hexdigest()
-        return CACHE_DIR / f"{hash_key}.wav"
-
-    def save_audio(self, pcm_data: bytes, path: Path):
-        """Save PCM data as WAV file."""
-        with wave.open(str(path), 'wb') as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(SAMPLE_WIDTH)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(pcm_data)
-        logger.debug(f"Saved audio to {path}")
-
-    def play_audio_async(self, audio_path: Path):
-        """Play audio file asynchronously."""
-        if sys.platform == "darwin":
-            cmd = ["afplay", str(audio_path)]
-        else:
-            # Try common Linux audio players
-            for player in [["paplay"], ["aplay", "-q"], ["mpv", "--really-quiet"]]:
-                try:
-                    subprocess.run([player[0], "--version"], capture_output=True)
-                    cmd = player + [str(audio_path)]
-                    break
-                except FileNotFoundError:
-                    continue
-            else:
-                logger.error("No audio player found")
-                return
+        # Feed fields one by one instead of hashing a concatenated copy of text
+        h = new_cache_hash()
+        h.update(text.encode())
+        for key in CACHE_KEY_FIELDS:
+            h.update(b"|")
+            h.update(str(config.get(key)).encode())
+        # Shard by the first two hex chars so no directory grows huge;
+        # shards are created on first write, see open_cache_part()
+        key = h.hexdigest()
+        return CACHE_DIR / key[:2] / f"{key[2:]}.pcm"
+
+    def save_temp_wav(self, audio_chunks: list[bytes]) -> Path:
+        """Save PCM chunks as a temp WAV file (for players that need a header)."""
+        # Format is fixed, so skip the wave module: header + chunks go out in
+        # one unbuffered writev, without joining the chunks first
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False, buffering=0) as tmp:
+            os.writev(tmp.fileno(), [wav_header(sum(map(len, audio_chunks))), *audio_chunks])
+        logger.debug(f"Saved WAV to {tmp.name}")
+        return Path(tmp.name)
+
+    async def play_audio_async(self, audio_path: Path, delete_after: bool = False):
+        """Start playing an audio file once the previous one has finished,
+        without waiting for this one to finish.
+
+        With delete_after, the file is removed once the player has exited.
+        """
+        if not self.file_player:
+            logger.error("No audio player found")
+            if delete_after:
+                audio_path.unlink(missing_ok=True)
+            return
 
-        subprocess.Popen(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
+        # Queue behind the previous player before awaiting it, so concurrent
+        # callers start one after another
+        previous = self.player_done
+        done = self.player_done = asyncio.get_running_loop().create_future()
+        try:
+            if previous:
+                await previous
+            # posix_spawn (vfork + exec under glibc) doesn't copy the daemon's
+            # page tables the way fork does; the pid is reaped by reap_players()
+            pid = os.posix_spawnp(
+                self.file_player[0], self.file_player + [str(audio_path)], os.environ,
+                file_actions=PLAYER_FILE_ACTIONS, setsid=True
+            )
+        except BaseException:
+            # Don't hold up the queue behind a player that never started
+            done.set_result(None)
+            if delete_after:
+                audio_path.unlink(missing_ok=True)
+            raise
+        self.player_pids[pid] = (audio_path if delete_after else None, done)
+        if not self.reaper_task:
+            self.reaper_task = asyncio.create_task(self.reap_players())
         logger.debug(f"Playing {audio_path}")
 
+    async def reap_players(self):
+        """Collect exited file players until none are left, deleting their
+        temp files and releasing the next queued player."""
+        try:
+            while self.player_pids:
+                await asyncio.sleep(REAP_INTERVAL)
+                for pid in list(self.player_pids):
+                    try:
+                        done, _ = os.waitpid(pid, os.WNOHANG)
+                    except ChildProcessError:
+                        done = pid
+                    if done:
+                        tmp_path, done = self.player_pids.pop(pid)
+                        if tmp_path:
+                            tmp_path.unlink(missing_ok=True)
+                        done.set_result(None)
+        finally:
+            self.reaper_task = None
+
+    def get_pcm_player(self) -> Optional[subprocess.Popen]:
+        """Return the long-lived raw PCM player, spawning it if needed."""
+        if self.pcm_player and self.pcm_player.poll() is None:
+            return self.pcm_player
+
+        self.pcm_player = None
+        for cmd in RAW_PLAYERS:
+            try:
+                self.pcm_player = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                logger.debug(f"Started PCM player: {cmd[0]}")
+                break
+            except FileNotFoundError:
+                continue
+        return self.pcm_player
+
+    def write_pcm(self, pcm_data: bytes) -> bool:
+        """Write one utterance to the player's stdin (blocks while the pipe is full)."""
+        with self.pcm_player_lock:
+            return self.pipe_pcm(pcm_data) and self.pipe_pcm(UTTERANCE_GAP)
+
+    def pipe_pcm(self, pcm_data: bytes) -> bool:
+        """Write PCM to the player's stdin; caller holds pcm_player_lock."""
+        player = self.get_pcm_player()
+        if not player:
+            return False
+        try:
+            player.stdin.write(pcm_data)
+            player.stdin.flush()
+            return True
+        except (BrokenPipeError, OSError) as e:
+            logger.warning(f"PCM player write failed: {e}")
+            self.pcm_player = None
+            return False
+
+    def open_pcm_player(self) -> bool:
+        """get_pcm_player() under the player lock, for use from worker threads."""
+        # A writer may hold the lock for a whole utterance: then the player is
+        # up, and waiting here would hold back synthesis of the next request
+        if not self.pcm_player_lock.acquire(blocking=False):
+            return True
+        try:
+            return self.get_pcm_player() is not None
+        finally:
+            self.pcm_player_lock.release()
+
+    async def play_pcm(self, pcm_data: bytes):
+        """Play PCM via the warm player, falling back to a per-file player."""
+        if not await asyncio.to_thread(self.write_pcm, pcm_data):
+            await self.play_audio_streaming([pcm_data])
+
+    def stop_pcm_player(self):
+        """Close the long-lived PCM player."""
+        if self.pcm_player:
+            try:
+                self.pcm_player.stdin.close()
+            except OSError:
+                pass
+            self.pcm_player = None
+
+    def get_play_stream(self):
+        """Return the long-lived sounddevice output stream, opening it if needed."""
+        if self.play_stream is None:
+            self.play_stream = sd.OutputStream(
+                samplerate=SAMPLE_RATE,
+                channels=CHANNELS,
+                dtype='int16',
+                blocksize=2048,
+                latency='high'
+            )
+            self.play_stream.start()
+            logger.debug("Playback stream opened")
+        return self.play_stream
+
+    def close_play_stream(self):
+        """Close the long-lived sounddevice output stream."""
+        if self.play_stream is not None:
+            try:
+                self.play_stream.close()
+            except Exception:
+                pass
+            self.play_stream = None
+
+    def write_play_stream(self, pcm_data: bytes):
+        """Play PCM on the shared stream; blocks until the device has taken it."""
+        audio = np.frombuffer(pcm_data, dtype=np.int16).reshape(-1, CHANNELS)
+        with self.play_stream_lock:
+            try:
+                self.get_play_stream().write(audio)
+            except sd.PortAudioError as e:
+                # Device changed or stream died: reopen once
+                logger.warning(f"Playback stream error: {e}, reopening")
+                self.close_play_stream()
+                self.get_play_stream().write(audio)
+
     async def play_audio_streaming(self, audio_chunks: list[bytes]):
         """Play audio with streaming - start playback as soon as first chunk arrives."""
         if not audio_chunks:
             return
 
-        # Combine all chunks
-        pcm_data = b''.join(audio_chunks)
-
-        # Save to temp file and play
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            self.save_audio(pcm_data, tmp_path)
-
-        self.play_audio_async(tmp_path)
-
-        # Schedule cleanup after playback (estimate duration + buffer)
-        duration = len(pcm_data) / (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS)
-        await asyncio.sleep(duration + 1)
-        try:
-            tmp_path.unlink()
-        except:
-            pass
+        # Save to temp file (off the event loop) and play; the reaper deletes
+        # it when the player exits, so nothing waits here
+        tmp_path = await asyncio.to_thread(self.save_temp_wav, audio_chunks)
+        await self.play_audio_async(tmp_path, delete_after=True)
 
     async def connect_live_api(self, tts_config: dict):
         """Establish WebSocket connection to Gemini Live API."""
+        opened = await self.open_session(tts_config)
+        if not opened:
+            return False
+        self.session, self.session_cm = opened
+        # Store current config for cache key comparison
+        self.current_config = tts_config.copy()
+        self.reconnect_delay = 1  # Reset on successful connect
+        return True
+
+    async def open_session(self, tts_config: dict) -> Optional[tuple]:
+        """Open a Live API session for this config; returns (session, session_cm)."""
         try:
             from google import genai
             from google.genai import types
         except ImportError:
             logger.error("google-genai not installed. Run: pip install google-genai")
-            return False
+            return None
 
         if not GEMINI_API_KEY:
             logger.error("GEMINI_API_KEY not set")
-            return False
+            return None
+
+        if not self.make_turn:
+            # Bound once: run_turn then skips the import lookup per request
+            self.make_turn = lambda text: [types.Content(role="user", parts=[types.Part(text=text)])]
 
         try:
             self.client = genai.Client(api_key=GEMINI_API_KEY)
 
             voice = tts_config.get("voice", "Aoede")
-            instruction = build_instruction(tts_config)
+            instruction = instruction_for(tts_config)
 
             config = types.LiveConnectConfig(
                 response_modalities=["AUDIO"],
@@ -380,19 +822,87 @@ class TTSDaemon:
                 system_instruction=instruction
             )
 
-            # Store current config for cache key comparison
-            self.current_config = tts_config.copy()
-
             # Get the async context manager and enter it manually
-            self.session_cm = self.client.aio.live.connect(model=MODEL, config=config)
-            self.session = await self.session_cm.__aenter__()
-            self.reconnect_delay = 1  # Reset on successful connect
+            session_cm = self.client.aio.live.connect(model=MODEL, config=config)
+            session = await session_cm.__aenter__()
+            self.tune_session_socket(session)
             logger.info(f"Connected to Gemini Live API (voice={voice}, instruction={instruction[:50]}...)")
-            return True
+            return session, session_cm
 
         except Exception as e:
             logger.error(f"Failed to connect to Live API: {e}")
+            return None
+
+    def tune_session_socket(self, session):
+        """Disable Nagle on the Live API WebSocket so small turns go out immediately.
+
+        google-genai doesn't expose the socket, so this reaches into the
+        session's private websockets connection and is best-effort.
+        """
+        try:
+            transport = session._ws.transport
+            sock = transport.get_extra_info('socket')
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 64 * 1024)
+            logger.debug("TCP_NODELAY set on Live API socket")
+        except Exception as e:
+            logger.debug(f"Could not tune Live API socket: {e}")
+
+    @staticmethod
+    def session_key(config: dict) -> tuple:
+        """Config fields that define a Live session."""
+        style = config.get("style")
+        return (
+            config.get("voice"), style, config.get("mode"), config.get("language"),
+            config.get("custom_styles", {}).get(style)
+        )
+
+    async def close_session_cm(self, session_cm):
+        """Exit a Live session context manager, ignoring errors."""
+        try:
+            await session_cm.__aexit__(None, None, None)
+        except:
+            pass
+
+    async def park_session(self):
+        """Move the current session into the idle pool instead of closing it."""
+        if not self.session:
+            return
+        await self.pool_session(self.session, self.session_cm, self.current_config)
+        self.session = None
+        self.session_cm = None
+
+    async def pool_session(self, session, session_cm, config: dict):
+        """Add an idle session to the pool, evicting the longest-idle ones."""
+        key = self.session_key(config)
+        old = self.session_pool.pop(key, None)
+        if old:
+            await self.close_session_cm(old[1])
+        self.session_pool[key] = (session, session_cm, config, time.monotonic())
+
+        # Bounded pool: drop the longest-idle sessions (dicts keep insertion order)
+        while len(self.session_pool) > SESSION_POOL_SIZE:
+            oldest = next(iter(self.session_pool))
+            await self.close_session_cm(self.session_pool.pop(oldest)[1])
+
+    async def restore_session(self, tts_config: dict) -> bool:
+        """Reuse a pooled session for this config if one is still fresh."""
+        entry = await self.take_pooled_session(tts_config)
+        if not entry:
             return False
+        self.session, self.session_cm, self.current_config = entry
+        return True
+
+    async def take_pooled_session(self, tts_config: dict) -> Optional[tuple]:
+        """Pop a fresh pooled session for this config as (session, session_cm, config)."""
+        entry = self.session_pool.pop(self.session_key(tts_config), None)
+        if not entry:
+            return None
+        session, session_cm, config, parked_at = entry
+        if time.monotonic() - parked_at > SESSION_POOL_MAX_IDLE:
+            await self.close_session_cm(session_cm)
+            return None
+        return session, session_cm, config
 
     def config_changed(self, new_config: dict) -> bool:
         """Check if config changed requiring reconnection."""
@@ -411,82 +921,167 @@ class TTSDaemon:
                 return True
         return False
 
-    async def synthesize_live(self, text: str, tts_config: dict, player: Optional['StreamingAudioPlayer'] = None) -> Optional[bytes]:
+    async def synthesize_live(self, text: str, tts_config: dict, player: Optional['StreamingAudioPlayer'] = None,
+                              sink=None) -> Optional[bytearray]:
         """Synthesize speech using Live API WebSocket with optional streaming playback."""
-        from google.genai import types
+        # A Live session carries one turn at a time; rather than queue behind
+        # a turn in progress, run the overlapping request on a spare session
+        if self.session_lock.locked():
+            return await self.synthesize_spare(text, tts_config, player, sink)
+
+        async with self.session_lock:
+            # Switch sessions if config changed: reuse a pooled one or reconnect
+            if self.config_changed(tts_config):
+                await self.park_session()
+                if await self.restore_session(tts_config):
+                    logger.info("Config changed, reusing pooled session")
+                else:
+                    logger.info("Config changed, reconnecting...")
 
-        # Reconnect if config changed
-        if self.config_changed(tts_config):
-            if self.session_cm:
-                try:
-                    await self.session_cm.__aexit__(None, None, None)
-                except:
-                    pass
-                self.session = None
-                self.session_cm = None
-            logger.info("Config changed, reconnecting...")
+            for attempt in range(2):
+                fresh = not self.session
+                if fresh and not await self.connect_live_api(tts_config):
+                    return None
 
-        if not self.session:
-            if not await self.connect_live_api(tts_config):
-                return None
+                try:
+                    return await self.run_turn(self.session, text, player, sink)
+                except Exception as e:
+                    logger.error(f"Live API synthesis error: {e}")
+                    # Close session and force reconnect
+                    if self.session_cm:
+                        await self.close_session_cm(self.session_cm)
+                    self.session = None
+                    self.session_cm = None
+                    # A reused session may have been dropped while idle
+                    if fresh or attempt or not isinstance(e, TurnNotStarted):
+                        return None
+                    logger.info("Retrying on a new connection")
+
+    async def synthesize_spare(self, text: str, tts_config: dict, player: Optional['StreamingAudioPlayer'] = None,
+                               sink=None) -> Optional[bytearray]:
+        """Synthesize on a pooled or new session while the main one is busy."""
+        logger.info("Session busy, synthesizing on a spare session")
+        entry = await self.take_pooled_session(tts_config)
+        for attempt in range(2):
+            fresh = not entry
+            if entry:
+                session, session_cm, _ = entry
+                entry = None
+            else:
+                opened = await self.open_session(tts_config)
+                if not opened:
+                    return None
+                session, session_cm = opened
 
+            try:
+                audio = await self.run_turn(session, text, player, sink)
+                break
+            except Exception as e:
+                logger.error(f"Live API synthesis error: {e}")
+                await self.close_session_cm(session_cm)
+                # A pooled session may have been dropped while idle
+                if fresh or attempt or not isinstance(e, TurnNotStarted):
+                    return None
+                logger.info("Retrying on a new connection")
+
+        # Keep it for the next overlapping request
+        await self.pool_session(session, session_cm, tts_config.copy())
+        return audio
+
+    async def run_turn(self, session, text: str, player: Optional['StreamingAudioPlayer'] = None,
+                       sink=None) -> Optional[bytearray]:
+        """Send one turn and collect its audio, feeding the player and sink file as it arrives."""
+        chunk_count = 0
         try:
             # Send text to synthesize (summarization handled by system_instruction)
-            await self.session.send_client_content(
-                turns=[types.Content(role="user", parts=[types.Part(text=text)])],
-                turn_complete=True
-            )
+            await session.send_client_content(turns=self.make_turn(text), turn_complete=True)
+
+            # Collect audio (for cache) while streaming to player; one growing
+            # buffer instead of a chunk list + join, passed on without copying.
+            # Per-chunk work is hoisted: bound methods are looked up once and the
+            # debug f-strings are only built when debug logging is on
+            audio_buf = bytearray()
+            extend = audio_buf.extend
+            feed = player.feed if player else None
+            write = sink.write if sink else None
+            debug = logger.isEnabledFor(logging.DEBUG)
+            async for response in session.receive():
+                content = response.server_content
+                if debug:
+                    logger.debug(f"API response: {type(response).__name__}, has_server_content={bool(content)}")
+                if not content:
+                    continue
 
-            # Collect audio chunks (for cache) while streaming to player
-            audio_chunks = []
-            async for response in self.session.receive():
-                logger.debug(f"API response: {type(response).__name__}, has_server_content={bool(response.server_content)}")
-
-                if response.server_content:
-                    if response.server_content.model_turn:
-                        parts_count = len(response.server_content.model_turn.parts)
-                        logger.debug(f"model_turn: {parts_count} parts")
-                        for i, part in enumerate(response.server_content.model_turn.parts):
-                            logger.debug(f"Part {i}: has_inline_data={bool(part.inline_data)}, has_text={bool(part.text if hasattr(part, 'text') else False)}")
-                            if part.inline_data:
-                                logger.debug(f"  inline_data.mime_type={part.inline_data.mime_type if hasattr(part.inline_data, 'mime_type') else 'N/A'}")
-                                logger.debug(f"  inline_data.has_data={bool(part.inline_data.data)}")
-                            if part.inline_data and part.inline_data.data:
-                                chunk = part.inline_data.data
+                turn = content.model_turn
+                if turn:
+                    if debug:
+                        logger.debug(f"model_turn: {len(turn.parts)} parts")
+                    for i, part in enumerate(turn.parts):
+                        inline_data = part.inline_data
+                        if debug:
+                            logger.debug(f"Part {i}: has_inline_data={bool(inline_data)}, has_text={bool(getattr(part, 'text', None))}")
+                            if inline_data:
+                                logger.debug(f"  inline_data.mime_type={getattr(inline_data, 'mime_type', 'N/A')}")
+                                logger.debug(f"  inline_data.has_data={bool(inline_data.data)}")
+                        if inline_data and inline_data.data:
+                            chunk = inline_data.data
+                            if debug:
                                 logger.debug(f"Audio chunk: {len(chunk)} bytes")
-                                audio_chunks.append(chunk)
-                                # Stream to player immediately
-                                if player:
-                                    player.feed(chunk)
-
-                    # Check if turn is complete
-                    if response.server_content.turn_complete:
-                        logger.debug(f"Turn complete, total chunks: {len(audio_chunks)}")
-                        if player:
-                            player.finish()
-                        break
-
-            if audio_chunks:
-                return b''.join(audio_chunks)
-            logger.warning(f"No audio chunks received for text: {text[:100]}...")
-            return None
-
+                            extend(chunk)
+                            chunk_count += 1
+                            # Stream to player immediately
+                            if feed:
+                                feed(chunk)
+                            if write:
+                                write(chunk)
+
+                # Check if turn is complete
+                if content.turn_complete:
+                    logger.debug(f"Turn complete, total chunks: {chunk_count}")
+                    if player:
+                        player.finish()
+                    break
         except Exception as e:
-            logger.error(f"Live API synthesis error: {e}")
-            # Close session and force reconnect
-            if self.session_cm:
-                try:
-                    await self.session_cm.__aexit__(None, None, None)
-                except:
-                    pass
-            self.session = None
-            self.session_cm = None
-            return None
-
-    async def speak(self, text: str):
-        """Synthesize and play text, using cache if available."""
-        if not text.strip():
-            return
+            if not chunk_count:
+                # Nothing reached the player or the cache: safe to retry
+                raise TurnNotStarted(e) from e
+            raise
+
+        if audio_buf:
+            return audio_buf
+        logger.warning(f"No audio chunks received for text: {text[:100]}...")
+        return None
+
+    def resolve_hook_payload(self, data: bytes) -> str:
+        """Turn a raw Stop hook payload into text to speak; plain text passes through."""
+        try:
+            hook_data = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return data.decode('utf-8', errors='replace')
+        if not isinstance(hook_data, dict) or "transcript_path" not in hook_data:
+            return data.decode('utf-8', errors='replace')
+
+        # Fallback message if no transcript
+        transcript_path = hook_data.get("transcript_path") or ""
+        if not extract_last_assistant_message or not os.path.exists(transcript_path):
+            return "Done"
+        if not Path(transcript_path).resolve().is_relative_to(TRANSCRIPTS_DIR.resolve()):
+            logger.warning(f"Ignoring transcript outside {TRANSCRIPTS_DIR}: {transcript_path}")
+            return "Done"
+
+        return extract_last_assistant_message(transcript_path) or "Ready"
+
+    async def read_request(self, data: bytes) -> Optional[tuple[str, dict]]:
+        """Turn a queued request into (text, config); None if there is nothing to say.
+
+        Requests stay bytes until here: hook payloads are parsed as JSON
+        straight from bytes, only plain text gets decoded.
+        """
+        # Hook payload: read the transcript off the event loop
+        if data.startswith(b"{"):
+            text = await asyncio.to_thread(self.resolve_hook_payload, data)
+        else:
+            text = data.decode('utf-8', errors='replace')
 
         # Load config on each request
         tts_config = load_config()
@@ -498,73 +1093,235 @@ class TTSDaemon:
         if len(text) > max_chars:
             text = text[:max_chars]
             logger.debug(f"Truncated to {max_chars} chars")
+        if not text:
+            return None
+        return text, tts_config
 
-        cache_path = self.get_cache_path(text, tts_config)
+    async def speak(self, data: bytes):
+        """Synthesize and play a request, using cache if available."""
+        request = await self.read_request(data)
+        if not request:
+            return
+        text, tts_config = request
 
-        # Check cache
-        if cache_path.exists():
-            logger.debug(f"Cache hit: {text[:50]}...")
-            if HAS_SOUNDDEVICE:
-                # Stream from cache file
-                await self.play_cached_streaming(cache_path)
-            else:
-                self.play_audio_async(cache_path)
+        # Cache hits, and misses while the session is idle, go straight through
+        if not (self.pending_texts or self.session_lock.locked()) \
+                or self.cached_audio_path(text, tts_config):
+            await self.speak_text(text, tts_config)
             return
 
-        # Synthesize
+        # A synthesis is running: whoever opens a batch waits briefly and
+        # speaks every miss that arrived meanwhile in one turn
+        self.pending_texts.append(text)
+        if len(self.pending_texts) > 1:
+            return
+        await asyncio.sleep(COALESCE_WINDOW)
+
+        # With the other worker busy synthesizing, whatever arrived meanwhile
+        # is still queued: pull it into the batch rather than leave it waiting
+        hits = []
+        while True:
+            try:
+                data = self.speak_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                request = await self.read_request(data)
+            finally:
+                self.speak_queue.task_done()
+            if not request:
+                continue
+            if self.cached_audio_path(*request):
+                hits.append(request)
+            else:
+                self.pending_texts.append(request[0])
+
+        texts, self.pending_texts = self.pending_texts, []
+        if len(texts) > 1:
+            logger.debug(f"Coalesced {len(texts)} requests")
+            text = " ".join(t if t[-1] in ".!?…" else t + "." for t in texts)
+
+        await self.speak_text(text, tts_config)
+        for request in hits:
+            await self.speak_text(*request)
+
+    def cached_audio_path(self, text: str, tts_config: dict) -> Optional[Path]:
+        """Return the cache file for text if one is known to exist."""
+        # Repeats skip hashing, others are a set lookup
+        key = (text, *map(tts_config.get, CACHE_KEY_FIELDS))
+        cache_path = self.audio_paths.get(key)
+        if cache_path:
+            self.audio_paths.move_to_end(key)
+        else:
+            cache_path = self.get_cache_path(text, tts_config)
+            if str(cache_path) not in self.known_cache:
+                return None
+            self.remember_audio_path(key, cache_path)
+        return cache_path
+
+    async def speak_text(self, text: str, tts_config: dict):
+        """Play text from cache, or synthesize it while playing."""
+        key = (text, *map(tts_config.get, CACHE_KEY_FIELDS))
+        cache_path = self.cached_audio_path(text, tts_config)
+        if cache_path:
+            logger.debug(f"Cache hit: {text[:50]}...")
+            self.last_played[str(cache_path)] = time.time()
+            try:
+                if HAS_SOUNDDEVICE:
+                    # Stream from cache file
+                    await self.play_cached_streaming(cache_path)
+                else:
+                    await self.play_pcm(await asyncio.to_thread(load_pcm, cache_path))
+                return
+            except FileNotFoundError:
+                # Cache cleared behind our back: synthesize again
+                del self.audio_paths[key]
+                self.known_cache.discard(str(cache_path))
+        else:
+            cache_path = self.get_cache_path(text, tts_config)
+
+        # Synthesize; playback starts with the first chunk (sounddevice stream or
+        # the warm PCM player) instead of after the whole turn has been received
         logger.info(f"Synthesizing: {text[:50]}...")
-        pcm_data = await self.synthesize_live(text, tts_config)
+        player = await self.streaming_player()
+        pcm_data = None
+        try:
+            # Chunks go to a temp file next to the cache entry as they arrive;
+            # it is renamed into place only once the turn completes
+            part = await asyncio.to_thread(self.open_cache_part, cache_path)
+            try:
+                pcm_data = await self.synthesize_live(text, tts_config, player=player, sink=part)
+            finally:
+                # Publish (or drop) the file in a thread while playback drains
+                publish = asyncio.create_task(
+                    asyncio.to_thread(self.publish_cache_part, part, cache_path, bool(pcm_data))
+                )
+        finally:
+            # Flush whatever arrived, even if the turn broke off midway; on
+            # any error this also releases the player's output lock
+            if player:
+                player.finish()
+
+        if player:
+            await player.wait_done()
+            logger.debug("Playback completed")
 
+        await publish
         if pcm_data:
-            # Save to cache first
-            self.save_audio(pcm_data, cache_path)
+            self.remember_audio_path(key, cache_path)
+            self.known_cache.add(str(cache_path))
+            self.cache_bytes += len(pcm_data)
+            if self.cache_bytes > CACHE_MAX_BYTES and not self.evict_task:
+                self.evict_task = asyncio.create_task(self.trim_cache())
 
-            # Play using direct method
-            if HAS_SOUNDDEVICE:
-                logger.debug("Starting playback via sounddevice")
-                audio_array = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
-                duration = len(audio_array) / SAMPLE_RATE
-                logger.debug(f"Audio duration: {duration:.2f}s")
-
-                def play_with_wait(audio):
-                    sd.play(audio, samplerate=SAMPLE_RATE)
-                    sd.wait()
-                    time.sleep(0.5)  # buffer to ensure audio hardware finishes
-
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, play_with_wait, audio_array)
-                logger.debug("Playback completed")
-            else:
-                self.play_audio_async(cache_path)
+        if pcm_data:
+            if not player or player.failed:
+                await self.play_pcm(pcm_data)
         else:
             logger.error("Synthesis failed")
 
+    def open_cache_part(self, cache_path: Path):
+        """Create a temp file in the cache entry's shard, creating the shard if needed."""
+        cache_path.parent.mkdir(exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".part", delete=False)
+
+    def publish_cache_part(self, part, cache_path: Path, keep: bool):
+        """Close a temp cache file and atomically rename it into place, or delete it."""
+        part.close()
+        if keep:
+            os.replace(part.name, cache_path)
+            logger.debug(f"Saved audio to {cache_path}")
+        else:
+            os.unlink(part.name)
+
+    async def trim_cache(self):
+        """Run evict_cache() off the event loop and record the new cache size."""
+        try:
+            self.cache_bytes, present, evicted = await asyncio.to_thread(
+                self.evict_cache, dict(self.last_played)
+            )
+            # Files published while the scan ran are already in known_cache
+            self.known_cache |= present
+            self.known_cache -= evicted
+            for path in evicted:
+                self.last_played.pop(path, None)
+        except OSError as e:
+            logger.warning(f"Cache eviction failed: {e}")
+        finally:
+            self.evict_task = None
+
+    def evict_cache(self, last_played: dict[str, float]) -> tuple[int, set[str], set[str]]:
+        """Delete least recently used audio files while over CACHE_MAX_BYTES.
+
+        A file was last used at its latest of atime, mtime (written) and
+        last_played (hit in this run). Returns the remaining cache size and
+        the paths found and deleted. Uses os.scandir, whose entries carry
+        stat info from one directory read per shard.
+        """
+        files = []
+        total = 0
+        evicted: set[str] = set()
+        for shard in os.scandir(CACHE_DIR):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".pcm"):
+                    st = entry.stat()
+                    used = max(st.st_atime, st.st_mtime, last_played.get(entry.path, 0))
+                    files.append((used, st.st_size, entry.path))
+                    total += st.st_size
+        present = {path for _, _, path in files}
+        if total <= CACHE_MAX_BYTES:
+            return total, present, evicted
+
+        files.sort()
+        target = CACHE_MAX_BYTES * CACHE_LOW_WATER
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted.add(path)
+        logger.info(f"Evicted {len(evicted)} cached files, cache is now {total // (1024 * 1024)} MiB")
+        return total, present - evicted, evicted
+
+    def remember_audio_path(self, key: tuple, path: Path):
+        """Record an existing cache file, evicting the least recently used entry."""
+        self.audio_paths[key] = path
+        if len(self.audio_paths) > AUDIO_PATH_CACHE_SIZE:
+            self.audio_paths.popitem(last=False)
+
+    async def streaming_player(self):
+        """Player fed with live chunks: the shared output stream or the warm PCM player."""
+        if not HAS_SOUNDDEVICE:
+            if await asyncio.to_thread(self.open_pcm_player):
+                return PipeAudioPlayer(self.pipe_pcm, self.pcm_player_lock)
+            return None
+        # The writer opens the shared stream once the first chunks arrive, so
+        # synthesis isn't held up while the previous utterance still plays;
+        # if that fails, the player is marked failed and speak_text falls back
+        return StreamingAudioPlayer(SAMPLE_RATE, CHANNELS, open_stream=self.get_play_stream,
+                                    stream_lock=self.play_stream_lock)
+
     async def play_cached_streaming(self, cache_path: Path):
         """Play cached audio file using direct playback."""
-        import wave
-        with wave.open(str(cache_path), 'rb') as wf:
-            pcm_data = wf.readframes(wf.getnframes())
+        pcm_data = await asyncio.to_thread(load_pcm, cache_path)
 
-        audio_array = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
-        duration = len(audio_array) / SAMPLE_RATE
+        duration = len(pcm_data) / (SAMPLE_RATE * SAMPLE_WIDTH * CHANNELS)
         logger.debug(f"Playing cached audio: {duration:.2f}s")
-
-        def play_with_wait(audio):
-            sd.play(audio, samplerate=SAMPLE_RATE)
-            sd.wait()
-            time.sleep(0.5)  # buffer to ensure audio hardware finishes
-
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, play_with_wait, audio_array)
+        await asyncio.to_thread(self.write_play_stream, pcm_data)
 
     async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle incoming socket connection."""
         try:
-            data = await asyncio.wait_for(reader.read(4096), timeout=5.0)
+            data = await asyncio.wait_for(self.read_message(reader), timeout=5.0)
+            data = data.strip()
             if data:
-                text = data.decode('utf-8').strip()
-                logger.debug(f"Received: {text[:100]}...")
-                await self.speak(text)
+                logger.debug(f"Received: {data[:100].decode('utf-8', errors='replace')}...")
+                await self.speak_queue.put(data)
         except asyncio.TimeoutError:
             logger.warning("Client read timeout")
         except Exception as e:
@@ -573,15 +1330,42 @@ class TTSDaemon:
             writer.close()
             await writer.wait_closed()
 
+    async def read_message(self, reader: asyncio.StreamReader) -> bytes:
+        """Read one message: length-prefixed, or unframed text for manual testing."""
+        head = await reader.read(4)
+        if not head:
+            return b""
+        if head[0]:
+            # Unframed: one line, or everything up to EOF without a newline
+            if b"\n" in head:
+                return head
+            try:
+                return head + await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                return head + e.partial
+            except asyncio.LimitOverrunError:
+                logger.warning("Message too large")
+                return b""
+        if len(head) < 4:
+            head += await reader.readexactly(4 - len(head))
+        n = struct.unpack('!I', head)[0]
+        if n > MAX_MSG:
+            logger.warning(f"Message too large: {n} bytes")
+            return b""
+        return await reader.readexactly(n)
+
     async def start_socket_server(self):
         """Start Unix socket server."""
         # Remove existing socket
-        if SOCKET_PATH.exists():
-            SOCKET_PATH.unlink()
+        SOCKET_PATH.unlink(missing_ok=True)
 
+        # Larger accept backlog than asyncio's default 100 for hook bursts
+        # (the kernel caps it at net.core.somaxconn)
         server = await asyncio.start_unix_server(
             self.handle_client,
-            path=str(SOCKET_PATH)
+            path=str(SOCKET_PATH),
+            limit=MAX_MSG,
+            backlog=512
         )
 
         # Make socket accessible
@@ -590,6 +1374,44 @@ class TTSDaemon:
 
         return server
 
+    def handle_datagram(self, data: bytes):
+        """Handle a message received on the datagram socket."""
+        data = data.strip()
+        if not data:
+            return
+        logger.debug(f"Received datagram: {data[:100].decode('utf-8', errors='replace')}...")
+        try:
+            self.speak_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("Speak queue full, dropping datagram")
+
+    async def speak_worker(self):
+        """Speak queued requests one at a time."""
+        while True:
+            data = await self.speak_queue.get()
+            try:
+                await self.speak(data)
+            except Exception as e:
+                logger.error(f"Speak error: {e}")
+            finally:
+                self.speak_queue.task_done()
+
+    async def start_datagram_server(self):
+        """Start Unix datagram socket (no connect/accept per message)."""
+        DGRAM_SOCKET_PATH.unlink(missing_ok=True)
+
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: DatagramHandler(self.handle_datagram),
+            local_addr=str(DGRAM_SOCKET_PATH),
+            family=socket.AF_UNIX
+        )
+
+        os.chmod(DGRAM_SOCKET_PATH, 0o666)
+        logger.info(f"Listening on {DGRAM_SOCKET_PATH}")
+
+        return transport
+
     # ========== HTTP API ==========
 
     async def api_get_config(self, request):
@@ -655,15 +1477,7 @@ class TTSDaemon:
 
         if pcm_data:
             if HAS_SOUNDDEVICE:
-                audio_array = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
-
-                def play_with_wait(audio):
-                    sd.play(audio, samplerate=SAMPLE_RATE)
-                    sd.wait()
-                    time.sleep(0.5)
-
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, play_with_wait, audio_array)
+                await asyncio.to_thread(self.write_play_stream, pcm_data)
 
             return web.json_response({"status": "ok"})
         else:
@@ -709,13 +1523,31 @@ class TTSDaemon:
         logger.info(f"Web UI available at http://localhost:{HTTP_PORT}")
         return runner
 
+    async def ping_session(self, session) -> bool:
+        """WebSocket-level ping; unlike an empty turn it adds nothing to the model context."""
+        try:
+            pong_waiter = await session._ws.ping()
+            await asyncio.wait_for(pong_waiter, timeout=KEEPALIVE_TIMEOUT)
+            return True
+        except AttributeError:
+            return True  # google-genai internals changed; can't ping, assume alive
+        except Exception as e:
+            logger.warning(f"Keepalive ping failed: {e}")
+            return False
+
     async def maintain_connection(self):
-        """Keep WebSocket connection alive with periodic reconnection."""
+        """Keep WebSocket connection alive with keepalive pings and reconnection."""
+        last_ping = time.monotonic()
         while self.running:
             if not self.session:
-                tts_config = load_config()
-                logger.info("Attempting to connect...")
-                if await self.connect_live_api(tts_config):
+                # Under the session lock so a request can't connect or switch
+                # sessions at the same time
+                async with self.session_lock:
+                    connected = bool(self.session)
+                    if not connected:
+                        logger.info("Attempting to connect...")
+                        connected = await self.connect_live_api(load_config())
+                if connected:
                     self.reconnect_delay = 1
                 else:
                     logger.info(f"Reconnecting in {self.reconnect_delay}s...")
@@ -723,6 +1555,19 @@ class TTSDaemon:
                     self.reconnect_delay = min(self.reconnect_delay * 2, self.max_reconnect_delay)
             else:
                 await asyncio.sleep(5)  # Check connection every 5s
+                # A turn in progress keeps the socket busy anyway: skip the ping
+                if (self.session and not self.session_lock.locked()
+                        and time.monotonic() - last_ping >= KEEPALIVE_INTERVAL):
+                    last_ping = time.monotonic()
+                    session, session_cm = self.session, self.session_cm
+                    if not await self.ping_session(session):
+                        # Reconnect now rather than on the next request, unless
+                        # a request replaced the session while we were pinging
+                        async with self.session_lock:
+                            if self.session is session:
+                                self.session = None
+                                self.session_cm = None
+                                await self.close_session_cm(session_cm)
 
     def write_pid(self):
         """Write PID file."""
@@ -733,10 +1578,18 @@ class TTSDaemon:
         """Clean up resources."""
         logger.info("Cleaning up...")
 
-        if SOCKET_PATH.exists():
+        self.stop_pcm_player()
+        self.close_play_stream()
+
+        # Temp WAVs of players still running (open files stay readable)
+        for tmp_path, _ in self.player_pids.values():
+            if tmp_path:
+                tmp_path.unlink(missing_ok=True)
+
+        for path in (SOCKET_PATH, DGRAM_SOCKET_PATH):
             try:
-                SOCKET_PATH.unlink()
-            except:
+                path.unlink(missing_ok=True)
+            except OSError:
                 pass
 
         if PID_FILE.exists():
@@ -751,23 +1604,37 @@ class TTSDaemon:
         self.write_pid()
 
         # Setup signal handlers
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
             loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown()))
 
         try:
             # Start socket server
             server = await self.start_socket_server()
+            dgram_transport = await self.start_datagram_server()
 
             # Start HTTP server for web UI
             http_runner = await self.start_http_server()
 
+            # Pre-warm the player so the first utterance skips device/process setup
+            if HAS_SOUNDDEVICE:
+                try:
+                    await asyncio.to_thread(self.get_play_stream)
+                except Exception as e:
+                    logger.warning(f"Could not open playback stream: {e}")
+            else:
+                self.get_pcm_player()
+
+            # Measure (and if needed trim) the audio cache
+            await self.trim_cache()
+
             # Initial connection with config
             tts_config = load_config()
             await self.connect_live_api(tts_config)
 
             # Start connection maintainer
             maintain_task = asyncio.create_task(self.maintain_connection())
+            speak_tasks = [asyncio.create_task(self.speak_worker()) for _ in range(SPEAK_WORKERS)]
 
             # Run server
             async with server:
@@ -791,8 +1658,12 @@ class TTSDaemon:
             self.session = None
             self.session_cm = None
 
+        for entry in self.session_pool.values():
+            await self.close_session_cm(entry[1])
+        self.session_pool.clear()
+
         # Stop event loop
-        asyncio.get_event_loop().stop()
+        asyncio.get_running_loop().stop()
 
 
 def is_daemon_running() -> bool:
@@ -825,7 +1696,10 @@ def main():
     daemon = TTSDaemon()
 
     try:
-        asyncio.run(daemon.run())
+        if HAS_UVLOOP:
+            uvloop.run(daemon.run())
+        else:
+            asyncio.run(daemon.run())
     except KeyboardInterrupt:
         pass
     finally: